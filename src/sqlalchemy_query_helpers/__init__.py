@@ -1,3 +1,11 @@
 from .main import DB
 
-__all__ = ['DB']
+__all__ = ['DB', 'AsyncDB']
+
+
+def __getattr__(name):
+    # AsyncDB needs sqlalchemy[asyncio] (greenlet), import it only on use
+    if name == 'AsyncDB':
+        from .asyncdb import AsyncDB
+        return AsyncDB
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,79 @@
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncEngine, AsyncSession
+from sqlalchemy.orm import DeclarativeMeta
+from sqlalchemy.dialects.mysql import insert
+from typing import Union
+
+from .main import _HelpersMixin, PAGE_SIZE
+
+
+class AsyncDB(_HelpersMixin):
+    """Async variant of DB with AsyncEngine and AsyncSession, for concurrent queries by asyncio.gather().
+    Each call uses its own session from the pool, so calls can run concurrently:
+
+        await asyncio.gather(*[db.insert_many(t, chunk) for chunk in chunks])
+
+    Tables are created by `await db.create_all()`. Needs the 'async' extra (asyncmy driver and greenlet).
+    """
+    name: str
+    base: DeclarativeMeta = None
+    engine: AsyncEngine = None
+    Session: async_sessionmaker = None
+    session: AsyncSession = None
+
+    def __init__(self, db_name, base: DeclarativeMeta, db_url: str | None = None, echo=False,
+                 pool_size: int = 5, pool_pre_ping=True,
+                 driver: str = 'asyncmy'):
+        """
+        :param driver: async MySQL driver, 'asyncmy' or 'aiomysql'.
+        Other params as in DB.
+        """
+        self.base = base
+        engine_str = self.make_engine_str(db_url, driver)
+        self.engine = create_async_engine(f'{engine_str}/{db_name}', echo=echo,
+                                          pool_size=pool_size, pool_pre_ping=pool_pre_ping)
+        self.Session = async_sessionmaker(bind=self.engine)
+        self.name = self.engine.url.database
+
+    async def __aenter__(self):
+        """Open self.session as AsyncSession, it's committed (or rolled back on exception) and closed on exit."""
+        self.session = self.Session()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        try:
+            if exc_type is None:
+                await self.session.commit()
+            else:
+                await self.session.rollback()
+        finally:
+            await self.session.close()
+            self.session = None
+
+    async def create_all(self):
+        """Create tables and index if not exists."""
+        async with self.engine.begin() as conn:
+            await conn.run_sync(self.base.metadata.create_all)
+
+    async def insert_many(self, t, rows: Union[list, tuple], mfields: Union[list, tuple] = None, do_commit=True,
+                          page_size: int = PAGE_SIZE):
+        async with self.Session() as session:
+            for payload in self._payloads(rows, mfields, page_size, use_orm_keys=True):
+                await session.execute(insert(t), payload)
+            if do_commit:
+                await session.commit()
+
+    async def upsert(self, t, rows: Union[list[dict], tuple[dict]], mfields=None, do_commit=True,
+                     filter_unque_primary_keys=True) -> int:
+        """:return: MySQL affected rows"""
+        upsert_query = self._upsert_query(t, rows, mfields, filter_unque_primary_keys)
+        if upsert_query is None:
+            return 0
+        async with self.Session() as session:
+            r = await session.execute(upsert_query)
+            if do_commit:
+                try:
+                    await session.commit()
+                except Exception as e:
+                    await session.rollback()
+                    return 0
+        return r.rowcount